@@ -1,5 +1,8 @@
 from PyInstaller.utils.hooks import collect_data_files, collect_entry_point
 
 datas, hiddenimports = collect_entry_point("superqt.fonticon")
-for hiddenimport in hiddenimports:
-    datas += collect_data_files(hiddenimport)
+# collect_data_files walks the whole package tree on every call, and hidden
+# imports from the same distribution share a top-level package; collect each
+# top-level package only once.
+for pkg in {hiddenimport.split(".")[0] for hiddenimport in hiddenimports}:
+    datas += collect_data_files(pkg)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gc
 import importlib
 import importlib.util
 import os
@@ -165,6 +166,13 @@ def create_mmgui(
     # close the PyInstaller splash screen if it exists
     _close_splash_screen()
 
+    # Move everything created during startup (Qt objects, imported modules,
+    # widgets) into the GC's permanent generation. These objects live for the
+    # whole session anyway, and excluding them keeps collection pauses during
+    # acquisition proportional to newly created objects only.
+    gc.collect()
+    gc.freeze()
+
     if exec_app:
         app.exec()
     return win
@@ -10,7 +10,6 @@ from typing import TYPE_CHECKING, Literal, cast, overload
 from weakref import WeakValueDictionary
 
 from pymmcore_plus import CMMCorePlus
-from pymmcore_widgets import ConfigWizard
 from superqt import QIconifyIcon
 
 from pymmcore_gui._qt.QtAds import CDockManager, CDockWidget, SideBarLocation
@@ -405,10 +404,12 @@ class MicroManagerGUI(QMainWindow):
 
     def _on_system_config_loaded(self) -> None:
         settings = Settings.instance()
-        if cfg := self._mmc.systemConfigurationFile():
-            settings.last_config = Path(cfg)
-        else:
-            settings.last_config = None
+        cfg = self._mmc.systemConfigurationFile()
+        last_config = Path(cfg) if cfg else None
+        # reloading the same config is common; don't rewrite settings for a no-op
+        if settings.last_config == last_config:
+            return
+        settings.last_config = last_config
         settings.flush()
 
     def _add_toolbar(self, name: str, tb_entry: ToolDictValue) -> None:
@@ -527,9 +528,10 @@ class MicroManagerGUI(QMainWindow):
             return
 
         # if the widget is a dock widget, we want to toggle the dock widget
-        # rather than the inner widget
-        if action.key in self._dock_widgets:
-            widget = self.get_dock_widget(action.key)
+        # rather than the inner widget (single lookup; avoid probing the
+        # WeakValueDictionary twice per menu click)
+        if (dock := self._dock_widgets.get(action.key)) is not None:
+            widget: QWidget = dock
         else:
             # this will create the widget if it doesn't exist yet,
             # e.g. for a click event on a Toolbutton that doesn't yet have a widget
@@ -554,6 +556,10 @@ class MicroManagerGUI(QMainWindow):
         dw._viewer = ndv_viewer  # pyright: ignore reportAttributeAccessIssue]``
         dw.setWidget(q_viewer)
         dw.setFeature(dw.DockWidgetFeature.DockWidgetFloatable, False)
+        # MDA viewers are transient, one per sequence: destroy the dock (and
+        # release the viewer/dataset it pins) as soon as the user closes it,
+        # rather than hiding it and retaining the data for the whole session.
+        dw.setFeature(dw.DockWidgetFeature.DockWidgetDeleteOnClose, True)
         self.dock_manager.addDockWidgetTabToArea(dw, self._central_dock_area)
 
     def _on_previewer_created(self, dock_widget: CDockWidget) -> None:
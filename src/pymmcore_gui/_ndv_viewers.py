@@ -17,9 +17,6 @@ if TYPE_CHECKING:
     from collections.abc import Iterator
 
     import numpy as np
-    from ndv.models._array_display_model import (
-        IndexMap,  # pyright: ignore[reportPrivateImportUsage]
-    )
     from pymmcore_plus import CMMCorePlus
     from pymmcore_plus.metadata import FrameMetaV1, SummaryMetaV1
     from useq import MDASequence
@@ -59,6 +56,11 @@ class NDVViewersManager(QObject):
         self._is_mda_running = False
         self._follow_acquisition = True
         self._current_image_preview: CDockWidget | None = None
+        # python-side mirror of the preview dock's open/closed state, so the
+        # per-snap fast path below doesn't need a Qt call to check visibility
+        self._preview_visible = False
+        # most-recent frame index awaiting display (None if no flush scheduled)
+        self._pending_index: dict[Any, int] | None = None
 
         ev = self._mmc.events
         ev.imageSnapped.connect(self._on_image_snapped)
@@ -82,41 +84,54 @@ class NDVViewersManager(QObject):
     ) -> None:
         """Called when a new MDA sequence has been started."""
         self._is_mda_running = True
-        self._view = self._runner.get_view()
-        self._active_mda_viewer = self._create_ndv_viewer(self._view, sequence)
+        # discard any index still pending from a previous sequence
+        self._pending_index = None
+        # note: the viewer owns the view; don't keep a second strong reference
+        # here, or the manager would pin every sequence's data for its lifetime.
+        view = self._runner.get_view()
+        self._active_mda_viewer = self._create_ndv_viewer(view, sequence)
 
     def _on_frame_ready(
         self, frame: np.ndarray, event: useq.MDAEvent, meta: FrameMetaV1
     ) -> None:
         """Create a viewer if it does not exist, otherwise update the current index."""
-        if (viewer := self._active_mda_viewer) is None:
+        if self._active_mda_viewer is None:
             return  # pragma: no cover
         if not self._follow_acquisition:
             return
 
-        # Add a small delay to make sure the data are available in the handler
-        # This is a bit of a hack to get around the data handlers can write data
-        # asynchronously, so the data may not be available immediately to the viewer
-        # after the handler's frameReady method is called.
-        current_index = viewer.display_model.current_index
-        wrapper = viewer.data_wrapper
-
         # ome-writers flattens both "p" (position) and "g" (grid) into a single
         # "p" dimension, but useq events may use Axis.GRID ("g") as the key.
         # Remap so the viewer can find the correct axis.
         index = {("p" if str(k) == "g" else k): v for k, v in event.index.items()}
 
-        def _update(_idx: IndexMap = current_index) -> None:
-            try:
-                _idx.update(index.items())
-                if wrapper is not None:
-                    wrapper.data_changed.emit()
-            except Exception:  # pragma: no cover
-                # this happens if the viewer has been closed in the meantime
-                # usually it's a RuntimeError, but could be an EmitLoopError
-                return
+        # Coalesce updates: if a flush is already scheduled, just supersede the
+        # pending index. Frames can arrive far faster than the UI can render,
+        # and only the most recent index matters for display.
+        if self._pending_index is not None:
+            self._pending_index = index
+            return
+        self._pending_index = index
+
+        # Add a small delay to make sure the data are available in the handler
+        # This is a bit of a hack to get around the data handlers can write data
+        # asynchronously, so the data may not be available immediately to the viewer
+        # after the handler's frameReady method is called.
+        QTimer.singleShot(10, self._flush_current_index)
 
-        QTimer.singleShot(10, _update)
+    def _flush_current_index(self) -> None:
+        """Apply the most recently received frame index to the active viewer."""
+        index, self._pending_index = self._pending_index, None
+        if index is None or (viewer := self._active_mda_viewer) is None:
+            return  # pragma: no cover
+        try:
+            viewer.display_model.current_index.update(index.items())
+            if (wrapper := viewer.data_wrapper) is not None:
+                wrapper.data_changed.emit()
+        except Exception:  # pragma: no cover
+            # this happens if the viewer has been closed in the meantime
+            # usually it's a RuntimeError, but could be an EmitLoopError
+            return
 
     def _on_sequence_finished(self, sequence: useq.MDASequence) -> None:
         """Called when a sequence has finished."""
@@ -158,14 +173,37 @@ class NDVViewersManager(QObject):
 
             self._current_image_preview = dw
             self._preview_dock_widgets.add(dw)
+            # forget the dock when it is destroyed through *any* code path
+            # (user close button, dock manager teardown, app shutdown), so we
+            # never hold a dangling pointer and the next snap/stream simply
+            # creates a fresh preview.
+            dw.destroyed.connect(self._on_preview_dock_destroyed)
+            dw.viewToggled.connect(self._on_preview_view_toggled)
+            self._preview_visible = True
             dw.setWidget(preview)
             dw.setFeature(dw.DockWidgetFeature.DockWidgetFloatable, False)
             self.previewViewerCreated.emit(dw)
         else:
-            self._current_image_preview.toggleView(True)
+            dw = self._current_image_preview
+            # the flag only tracks open/closed: an open dock tabbed behind
+            # another (e.g. an MDA viewer) never emits viewToggled(False), so
+            # also check whether it is the current tab.  toggleView(True) on an
+            # already-open dock raises it to the front.
+            if not self._preview_visible or not dw.isCurrentTab():
+                dw.toggleView(True)
 
         return preview
 
+    def _on_preview_dock_destroyed(self, obj: QObject | None = None) -> None:
+        # an older (already-replaced) dock may be destroyed after a new one was
+        # created; only forget the dock that is actually current.
+        if obj is None or obj is self._current_image_preview:
+            self._current_image_preview = None
+            self._preview_visible = False
+
+    def _on_preview_view_toggled(self, open_: bool) -> None:
+        self._preview_visible = open_
+
     def _on_streaming_started(self) -> None:
         if not self._is_mda_running:
             if preview := self._create_or_show_img_preview():
@@ -196,8 +234,15 @@ class NDVViewersManager(QObject):
                 # (dtype is actually tuple of (dtype, shape))
                 preview = cast("NDVPreview", self._current_image_preview.widget())
                 if preview._get_core_dtype_shape() != preview.dtype_shape:
+                    dw, self._current_image_preview = self._current_image_preview, None
                     preview.detach()
-                    self._current_image_preview = None
+                    # unparent the inner widget before scheduling deletion, so the
+                    # dock widget doesn't keep the (GL-backed) preview alive until
+                    # the next return to the top-level event loop.
+                    dw.takeWidget()
+                    preview.deleteLater()
+                    dw.closeDockWidget()
+                    dw.deleteLater()
 
 
 # ---------------------------------------------------------------------------
@@ -218,18 +263,23 @@ def _add_follow_lock_button(
     if btn_layout is None:
         return
 
+    # build both icons once up front; QIconifyIcon does font lookup and glyph
+    # rendering, which needn't be repeated on every toggle
+    unlocked_icon = QIconifyIcon("mdi:lock-open-variant-outline")
+    locked_icon = QIconifyIcon("mdi:lock-outline")
+
     btn = QPushButton(q_widget)
     btn.setCheckable(True)
-    btn.setIcon(QIconifyIcon("mdi:lock-open-variant-outline"))
+    btn.setIcon(unlocked_icon)
     btn.setToolTip("Lock sliders (don't follow acquisition)")
     mgr_ref = weakref.ref(manager)
 
     def _toggled(locked: bool) -> None:
         if locked:
-            btn.setIcon(QIconifyIcon("mdi:lock-outline"))
+            btn.setIcon(locked_icon)
             btn.setToolTip("Unlock sliders (follow acquisition)")
         else:
-            btn.setIcon(QIconifyIcon("mdi:lock-open-variant-outline"))
+            btn.setIcon(unlocked_icon)
             btn.setToolTip("Lock sliders (don't follow acquisition)")
         if manager := mgr_ref():
             manager._follow_acquisition = not locked
@@ -31,6 +31,8 @@ USER_DATA_DIR.mkdir(parents=True, exist_ok=True)
 SETTINGS_FILE_NAME = USER_DATA_DIR / "pmm_settings.json"
 TESTING = "PYTEST_VERSION" in os.environ
 _GLOBAL_SETTINGS: "None | SettingsV1" = None
+# serialized settings most recently written to disk, used to skip no-op writes
+_LAST_WRITTEN: "None | str" = None
 
 
 class BaseMMSettings(BaseSettings):
@@ -262,8 +264,14 @@ class SettingsV1(BaseMMSettings):
             thread.join(timeout)
 
     def _write_settings(self) -> None:
+        global _LAST_WRITTEN
         json_str = self.model_dump_json(indent=2, exclude_defaults=True)
+        # flush() is called from several places (config load, window close, ...);
+        # skip the disk write entirely when nothing has actually changed
+        if json_str == _LAST_WRITTEN:
+            return
         SETTINGS_FILE_NAME.write_text(json_str, errors="ignore")
+        _LAST_WRITTEN = json_str
 
 
 Settings = SettingsV1
@@ -271,8 +279,9 @@ Settings = SettingsV1
 
 def reset_to_defaults() -> None:
     """Erase user settings and reset to defaults."""
-    global _GLOBAL_SETTINGS
+    global _GLOBAL_SETTINGS, _LAST_WRITTEN
     if TESTING or os.getenv("MMGUI_NO_SETTINGS"):  # pragma: no cover
         return
     SETTINGS_FILE_NAME.unlink(missing_ok=True)
     _GLOBAL_SETTINGS = SettingsV1()
+    _LAST_WRITTEN = None
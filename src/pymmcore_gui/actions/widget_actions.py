@@ -5,7 +5,6 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Annotated, TypeVar, cast
 
-import pymmcore_widgets as pmmw
 from pymmcore_plus import CMMCorePlus
 
 from pymmcore_gui._qt.QtAds import CDockWidget, DockWidgetArea, SideBarLocation
@@ -18,6 +17,8 @@ from ._action_info import ActionKey, WidgetActionInfo, _ensure_isinstance
 if TYPE_CHECKING:
     from pathlib import Path
 
+    import pymmcore_widgets as pmmw
+
     from pymmcore_gui._main_window import MicroManagerGUI
     from pymmcore_gui._qt.QtCore import QObject
     from pymmcore_gui.widgets._exception_log import ExceptionLog
@@ -101,6 +102,7 @@ def create_install_widgets(parent: QWidget) -> QDialog:
 
 def create_mda_widget(parent: QWidget) -> pmmw.MDAWidget:
     """Create the MDA widget."""
+    import pymmcore_widgets as pmmw
 
     class MDAWidget(pmmw.MDAWidget):
         """MDAWidget subclass: defaults to in-memory output and hides tiff-sequence."""
@@ -144,6 +146,8 @@ def create_config_groups(parent: QWidget) -> pmmw.GroupPresetTableWidget:
 
 def create_pixel_config(parent: QWidget) -> pmmw.PixelConfigurationWidget:
     """Create the Pixel Configuration widget."""
+    import pymmcore_widgets as pmmw
+
     from pymmcore_gui._qt.QtAds import CDockWidget
 
     class PixelConfigurationWidget(pmmw.PixelConfigurationWidget):
@@ -227,6 +231,8 @@ show_console = WidgetActionInfo(
     icon="iconoir:terminal",
     create_widget=create_mm_console,
     dock_area=DockWidgetArea.BottomDockWidgetArea,
+    # the console is its own scrollable viewport; don't nest it in another one
+    scroll_mode=CDockWidget.eInsertMode.ForceNoScrollArea,
 )
 
 show_property_browser = WidgetActionInfo(
@@ -236,6 +242,9 @@ show_property_browser = WidgetActionInfo(
     icon="mdi-light:format-list-bulleted",
     create_widget=create_property_browser,
     dock_area=SideBarLocation.SideBarLeft,
+    # the property table scrolls itself; a wrapping QScrollArea just doubles
+    # the layout machinery
+    scroll_mode=CDockWidget.eInsertMode.ForceNoScrollArea,
 )
 
 show_install_devices = WidgetActionInfo(
@@ -291,6 +300,8 @@ show_exception_log = WidgetActionInfo(
     icon="mdi-light:alert",
     create_widget=create_exception_log,
     dock_area=None,
+    # contains its own list/text viewports
+    scroll_mode=CDockWidget.eInsertMode.ForceNoScrollArea,
 )
 
 show_stage_control = WidgetActionInfo(
@@ -31,7 +31,7 @@ if TYPE_CHECKING:
     from qtconsole.rich_jupyter_widget import RichJupyterWidget
 
     from pymmcore_gui._qt.QtCore import QObject
-    from pymmcore_gui._qt.QtGui import QCloseEvent
+    from pymmcore_gui._qt.QtGui import QCloseEvent, QShowEvent
 
     # RichJupyterWidget has a very complex inheritance structure, and mypy/pyright
     # are unable to determine that it is a QWidget subclass. This is a workaround.
@@ -59,6 +59,16 @@ class MMConsole(QtConsole):
         if self._control is not None:
             self.setFocusProxy(self._control)
 
+    def _ensure_kernel(self) -> None:
+        """Start the in-process kernel, if it hasn't been started yet.
+
+        Starting the kernel takes a few hundred milliseconds (IPython machinery,
+        channel setup, variable injection), so it is deferred until the console
+        is first shown or used, rather than done at construction time.
+        """
+        if self.kernel_manager is not None:
+            return
+
         # Create an in-process kernel
         self.kernel_manager = QtInProcessKernelManager()
         self.kernel_manager.start_kernel()  # this creates .kernel attribute
@@ -76,6 +86,10 @@ class MMConsole(QtConsole):
 
         self._inject_core_vars()
 
+    def showEvent(self, a0: QShowEvent) -> None:
+        self._ensure_kernel()
+        super().showEvent(a0)
+
     def _inject_core_vars(self) -> None:
         import numpy
         import pymmcore_plus
@@ -116,10 +130,12 @@ class MMConsole(QtConsole):
         return "\n".join(lines)
 
     def push(self, variables: dict[str, Any]) -> None:
+        self._ensure_kernel()
         self.shell.push(variables)  # type: ignore [no-untyped-call]
 
     def get_user_variables(self) -> dict:
         """Return the variables pushed to the console."""
+        self._ensure_kernel()
         return {k: v for k, v in self.shell.user_ns.items() if k != "__builtins__"}
 
     def closeEvent(self, a0: QCloseEvent) -> None:
@@ -3,7 +3,6 @@ from __future__ import annotations
 from typing import cast
 
 from pymmcore_plus import CMMCorePlus, DeviceType
-from pymmcore_widgets import ShuttersWidget
 
 from pymmcore_gui._qt.QtWidgets import QToolBar, QWidget, QWidgetAction
 
@@ -69,6 +68,8 @@ class ShuttersToolbar(QToolBar):
         self._on_cfg_loaded()
 
     def _on_cfg_loaded(self) -> None:
+        from pymmcore_widgets import ShuttersWidget
+
         # delete current actions if any
         self._clear_shutter_toolbar()
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import suppress
 from typing import TYPE_CHECKING
 
 import ndv
@@ -27,7 +28,7 @@ class NDVPreview(ImagePreviewBase):
         use_with_mda: bool = False,
     ):
         super().__init__(parent, mmcore, use_with_mda=use_with_mda)
-        self._viewer = ndv.ArrayViewer()
+        self._viewer: ndv.ArrayViewer | None = ndv.ArrayViewer()
         self._buffer: RingBuffer | None = None
         self._core_dtype: tuple[str, tuple[int, ...]] | None = None
         self._is_rgb: bool = False
@@ -39,7 +40,24 @@ class NDVPreview(ImagePreviewBase):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(qwdg)
 
+    def detach(self) -> None:
+        """Detach from core events and drop references to the viewer and buffer.
+
+        Dropping the strong references here lets plain reference counting reclaim
+        the (potentially large) image buffer as soon as the widget is disposed,
+        rather than waiting for a generational GC pass to break up cycles.
+        """
+        super().detach()
+        if (viewer := self._viewer) is not None:
+            self._viewer = None
+            with suppress(Exception):
+                viewer.data = None
+        self._buffer = None
+        self._core_dtype = None
+
     def append(self, data: np.ndarray) -> None:
+        if (viewer := self._viewer) is None:
+            return  # pragma: no cover
         needs_setup = self._buffer is None
         if needs_setup:
             self._init_buffer()
@@ -47,8 +65,8 @@ class NDVPreview(ImagePreviewBase):
             self._buffer.append(data)
             if needs_setup:
                 self._apply_viewer_settings()
-            self._viewer.display_model.current_index.update({0: len(self._buffer) - 1})
-            self._viewer.data_wrapper.data_changed.emit()
+            viewer.display_model.current_index.update({0: len(self._buffer) - 1})
+            viewer.data_wrapper.data_changed.emit()
             if self.process_events_on_update:
                 QApplication.processEvents()
 
@@ -86,14 +104,16 @@ class NDVPreview(ImagePreviewBase):
 
     def _apply_viewer_settings(self) -> None:
         """Assign the buffer to the viewer and configure display settings."""
-        self._viewer.data = self._buffer
-        self._viewer.display_model.visible_axes = (1, 2)
+        if (viewer := self._viewer) is None:
+            return  # pragma: no cover
+        viewer.data = self._buffer
+        viewer.display_model.visible_axes = (1, 2)
         if self._is_rgb:  # RGB
-            self._viewer.display_model.channel_axis = 3
-            self._viewer.display_model.channel_mode = ndv.models.ChannelMode.RGBA
+            viewer.display_model.channel_axis = 3
+            viewer.display_model.channel_mode = ndv.models.ChannelMode.RGBA
         else:
-            self._viewer.display_model.channel_mode = ndv.models.ChannelMode.GRAYSCALE
-            self._viewer.display_model.channel_axis = None
+            viewer.display_model.channel_mode = ndv.models.ChannelMode.GRAYSCALE
+            viewer.display_model.channel_axis = None
 
     def _setup_viewer(self) -> None:
         """Create the buffer, assign to viewer, and configure display."""
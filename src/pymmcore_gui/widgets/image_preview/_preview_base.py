@@ -41,26 +41,33 @@ class ImagePreviewBase(QWidget):
         ev.systemConfigurationLoaded.connect(self._on_system_config_loaded)
         ev.roiSet.connect(self._on_roi_set)
         ev.propertyChanged.connect(self._on_property_changed)
-        core.mda.events.sequenceStarted.connect(
-            lambda: setattr(self, "_is_mda_running", True)
-        )
-        core.mda.events.sequenceFinished.connect(
-            lambda: setattr(self, "_is_mda_running", False)
-        )
+        core.mda.events.sequenceStarted.connect(self._on_mda_started)
+        core.mda.events.sequenceFinished.connect(self._on_mda_finished)
 
         self._mmc = core
 
     def detach(self) -> None:
-        """Detach this widget from events in `core`."""
-        if self._mmc is None:
+        """Detach this widget from events in `core`.
+
+        This must disconnect *every* signal connected in `attach`: each
+        remaining connection keeps the (possibly closed) widget alive and
+        receiving events.
+        """
+        if (core := self._mmc) is None:
             return  # pragma: no cover
+        self._mmc = None
         with suppress(Exception):
-            ev, self._mmc = self._mmc.events, None
+            ev = core.events
             ev.imageSnapped.disconnect(self._on_image_snapped)
             ev.continuousSequenceAcquisitionStarted.disconnect(self._on_streaming_start)
             ev.sequenceAcquisitionStarted.disconnect(self._on_streaming_start)
             ev.sequenceAcquisitionStopped.disconnect(self._on_streaming_stop)
             ev.exposureChanged.disconnect(self._on_exposure_changed)
+            ev.systemConfigurationLoaded.disconnect(self._on_system_config_loaded)
+            ev.roiSet.disconnect(self._on_roi_set)
+            ev.propertyChanged.disconnect(self._on_property_changed)
+            core.mda.events.sequenceStarted.disconnect(self._on_mda_started)
+            core.mda.events.sequenceFinished.disconnect(self._on_mda_finished)
 
     @abstractmethod
     def append(self, data: np.ndarray) -> None:
@@ -73,6 +80,12 @@ class ImagePreviewBase(QWidget):
 
     # ----------------------------
 
+    def _on_mda_started(self) -> None:
+        self._is_mda_running = True
+
+    def _on_mda_finished(self) -> None:
+        self._is_mda_running = False
+
     def _on_exposure_changed(self, device: str, value: str) -> None:
         # change timer interval
         if self._timer_id is not None:
@@ -71,6 +71,8 @@ class PygfxImagePreview(ImagePreviewBase):
         super().__init__(parent, mmcore, use_with_mda=use_with_mda)
 
         self._clims: tuple[float, float] | Literal["auto"] = "auto"
+        # min/max of the most recent frame, if it was computed in append()
+        self._last_auto_clim: tuple[float, float] | None = None
         self._cmap: Colormap = Colormap("gray")
 
         # IMAGE NODE
@@ -131,7 +133,14 @@ class PygfxImagePreview(ImagePreviewBase):
         Will also apply contrast limits if _clims is "auto".
         """
         if self._clims == "auto":
-            self._material.clim = np.min(data), np.max(data)
+            clim = self._last_auto_clim = (np.min(data), np.max(data))
+            # assigning to the material marks its uniforms dirty even for equal
+            # values; skip when the limits haven't actually moved
+            if clim != self._material.clim:
+                self._material.clim = clim
+        else:
+            # the cached auto-clim no longer describes the data on screen
+            self._last_auto_clim = None
         try:
             self._texture.set_data(data)
         except (ValueError, AttributeError):
@@ -156,7 +165,11 @@ class PygfxImagePreview(ImagePreviewBase):
         """
         self._clims = clims
         if clims == "auto":
-            if self.data is not None:
+            # reuse the limits computed on the last append, if available,
+            # rather than re-scanning the full frame
+            if (clim := self._last_auto_clim) is not None:
+                self._material.clim = clim
+            elif self.data is not None:
                 self._material.clim = np.min(self.data), np.max(self.data)
         else:
             self._material.clim = clims
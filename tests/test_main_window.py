@@ -131,21 +131,22 @@ def test_snap(gui: MicroManagerGUI, qtbot: QtBot) -> None:
     assert len(vm._preview_dock_widgets) == 1
 
     # change image dtype/shape.
-    # We should end up with a second preview widget
+    # We should end up with a new preview widget, and the stale one should be
+    # disposed rather than lingering in the dock manager
     core.setProperty(core.getCameraDevice(), "PixelType", "32bitRGB")
     with qtbot.waitSignal(vm.previewViewerCreated):
         core.snapImage()
     assert vm._current_image_preview is not preview
     preview = vm._current_image_preview
     assert preview is not None
-    assert len(vm._preview_dock_widgets) == 2
+    assert len(vm._preview_dock_widgets) == 1
 
     # but this should *not* create a new preview
     core.setProperty(core.getCameraDevice(), "Exposure", "42")
     with qtbot.waitSignal(core.events.imageSnapped):
         core.snapImage()
     assert vm._current_image_preview is preview
-    assert len(vm._preview_dock_widgets) == 2
+    assert len(vm._preview_dock_widgets) == 1
 
 
 @pytest.mark.skipif(